@@ -13,14 +13,23 @@ Usage (Streamlit):
 """
 
 import argparse
+import dataclasses
 import io
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import threading
 import time
-from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 from typing import List, Dict, Tuple, Optional
+from xml.sax.saxutils import escape
 
 import requests
-import openpyxl
-from openpyxl.styles import Font, Alignment, PatternFill
+from requests.adapters import HTTPAdapter
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle,
@@ -30,6 +39,210 @@ from reportlab.lib.units import inch
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
 
+# Optional faster JSON parser for API responses
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Optional on-disk HTTP cache for repeat searches
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# Excel backends: xlsxwriter is preferred; openpyxl is used if it is missing
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+try:
+    import openpyxl
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, Alignment, NamedStyle, PatternFill
+    from openpyxl.utils import get_column_letter
+except ImportError:
+    openpyxl = None
+
+logger = logging.getLogger(__name__)
+
+# PDF styles are built once at import; they carry no per-report state
+_STYLES = getSampleStyleSheet()
+_PDF_STYLES = {
+    "normal": _STYLES["Normal"],
+    "title": ParagraphStyle(
+        "CustomTitle", parent=_STYLES["Heading1"], fontSize=18,
+        textColor=colors.HexColor("#1f4788"), spaceAfter=30, alignment=TA_CENTER,
+    ),
+    "h1": ParagraphStyle(
+        "CustomHeading1", parent=_STYLES["Heading1"], fontSize=14,
+        textColor=colors.HexColor("#1f4788"), spaceAfter=12, spaceBefore=12,
+        borderWidth=1, borderColor=colors.HexColor("#1f4788"), borderPadding=5,
+    ),
+    "h2": ParagraphStyle(
+        "CustomHeading2", parent=_STYLES["Heading2"], fontSize=12,
+        textColor=colors.HexColor("#2E5C8A"), spaceAfter=10, spaceBefore=10,
+    ),
+    "body": ParagraphStyle(
+        "CustomBody", parent=_STYLES["Normal"], fontSize=10, leading=14,
+        alignment=TA_JUSTIFY,
+    ),
+    "citation": ParagraphStyle(
+        "Citation", parent=_STYLES["Normal"], fontSize=9, leftIndent=20,
+        textColor=colors.HexColor("#444444"), leading=12, spaceAfter=8,
+    ),
+    # Complete-list citation: the "citation" look, with the gap to the next entry
+    "entry_citation": ParagraphStyle(
+        "ListCitation", parent=_STYLES["Normal"], fontSize=9, leftIndent=20,
+        textColor=colors.HexColor("#444444"), leading=12, spaceAfter=18,
+    ),
+}
+_SUMMARY_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (0, -1), colors.HexColor("#E8EFF7")),
+    ("TEXTCOLOR", (0, 0), (-1, -1), colors.black),
+    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+    ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, -1), 10),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
+    ("TOPPADDING", (0, 0), (-1, -1), 8),
+    ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+])
+
+
+def _escape_attr(value: str) -> str:
+    """Escape *value* for use inside a double-quoted ReportLab markup attribute."""
+    return escape(value, {'"': "&quot;"})
+
+
+# E-utilities often report errors (e.g. an expired WebEnv) in an HTTP 200 body
+
+def _esearch_error(data: Dict) -> Optional[str]:
+    """Why an esearch JSON body is unusable, or None if it is a valid result."""
+    result = data.get("esearchresult")
+    if not isinstance(result, dict):
+        return str(data.get("error") or "no esearchresult in response")
+    if "ERROR" in result:
+        return str(result["ERROR"])
+    count = str(result.get("count", "0"))
+    if count.isdigit() and int(count) > 0 and not result.get("webenv"):
+        return "no WebEnv in response"
+    return None
+
+
+def _esummary_error(data: Dict) -> Optional[str]:
+    """Why an esummary JSON body is unusable, or None if it is a valid result."""
+    if "error" in data:
+        return str(data["error"])
+    result = data.get("result")
+    if not isinstance(result, dict) or "uids" not in result:
+        return "no result uids in response"
+    return None
+
+
+def _cacheable_response(response: requests.Response) -> bool:
+    """requests-cache filter that keeps E-utilities error bodies out of the cache."""
+    if "esearch.fcgi" in response.url:
+        check = _esearch_error
+    elif "esummary.fcgi" in response.url:
+        check = _esummary_error
+    else:
+        return True
+    try:
+        data = _json_loads(response.content)
+    except ValueError:
+        return False
+    return isinstance(data, dict) and check(data) is None
+
+
+class _RateLimiter:
+    """Spaces calls at least *interval* seconds apart, across threads."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+# Per-host limits are enforced process-wide, so concurrent searchers (e.g.
+# several Streamlit sessions) share one budget instead of one each
+_SHARED_LIMITS_LOCK = threading.Lock()
+_EUTILS_LIMITERS: Dict[Optional[str], _RateLimiter] = {}
+_HOST_SLOTS: Dict[str, threading.BoundedSemaphore] = {}
+
+
+def _shared_eutils_limiter(api_key: Optional[str]) -> _RateLimiter:
+    """The process-wide E-utilities rate limiter for *api_key* (or for no key).
+
+    NCBI allows 10 requests/second per API key, 3 per IP without one.
+    """
+    with _SHARED_LIMITS_LOCK:
+        limiter = _EUTILS_LIMITERS.get(api_key)
+        if limiter is None:
+            limiter = _EUTILS_LIMITERS[api_key] = _RateLimiter(0.1 if api_key else 0.34)
+        return limiter
+
+
+def _shared_host_slots(host: str, limit: int) -> threading.BoundedSemaphore:
+    """The process-wide cap of *limit* concurrent requests to *host*."""
+    with _SHARED_LIMITS_LOCK:
+        slots = _HOST_SLOTS.get(host)
+        if slots is None:
+            slots = _HOST_SLOTS[host] = threading.BoundedSemaphore(limit)
+        return slots
+
+
+@dataclass(slots=True)
+class Paper:
+    """One search result from PubMed, bioRxiv or medRxiv.
+
+    The underscore fields are derived for the reports and stay ``None``
+    until ``PKDLiteratureSearch._enrich`` fills them in (PubMed records get
+    ``_last_author`` at fetch time).
+    """
+
+    pmid: str
+    title: str
+    authors: str
+    journal: str
+    year: str
+    doi: str
+    source: str
+    _last_author: Optional[str] = None
+    _summary: Optional[str] = None
+    _key_findings: Optional[str] = None
+    _link: Optional[str] = None
+    _link_label: Optional[str] = None
+
+    def __post_init__(self):
+        # The same few journal and source names repeat across every record
+        self.journal = sys.intern(self.journal)
+        self.source = sys.intern(self.source)
+
+    def to_dict(self) -> Dict[str, str]:
+        """The record fields plus ``link`` (DOI, else PubMed) as a plain dict,
+        e.g. for JSON or a DataFrame."""
+        link = self._link if self._link is not None else PKDLiteratureSearch._paper_link(self)
+        return {
+            "pmid": self.pmid,
+            "title": self.title,
+            "authors": self.authors,
+            "journal": self.journal,
+            "year": self.year,
+            "doi": self.doi,
+            "source": self.source,
+            "link": link,
+        }
+
 
 class PKDLiteratureSearch:
     """Comprehensive PKD literature search across multiple databases.
@@ -38,124 +251,313 @@ class PKDLiteratureSearch:
     same class can power a CLI script *and* a Streamlit web app.
     """
 
-    def __init__(self, start_date: str, end_date: str, output_dir: str = "."):
+    USER_AGENT = "PKDLitSearch/1.0 (+https://github.com/blasseigne/PKDLitSearch)"
+
+    # Consortium papers can list hundreds of authors; citations keep the first N
+    MAX_AUTHORS = 50
+
+    # PubMed hits retrieved per search, and esummary records per request
+    PUBMED_MAX_RESULTS = 1000
+    PUBMED_PAGE_SIZE = 500
+
+    # Concurrent requests per host when fetching batches / pages. bioRxiv and
+    # medRxiv share api.biorxiv.org, so PREPRINT_WORKERS covers both, and it
+    # is capped process-wide across searchers.
+    PUBMED_WORKERS = 3
+    PREPRINT_WORKERS = 5
+
+    # Below this many papers, reports are cheaper to build in-process
+    REPORT_PROCESS_MIN_PAPERS = 500
+
+    def __init__(
+        self,
+        start_date: str,
+        end_date: str,
+        output_dir: str = ".",
+        api_key: Optional[str] = None,
+        use_cache: bool = True,
+        session: Optional[requests.Session] = None,
+    ):
         self.start_date = start_date
         self.end_date = end_date
         self.output_dir = output_dir
-        self.all_papers: List[Dict] = []
+        self.all_papers: List[Paper] = []
+        # Sources (as in Paper.source) with a request that failed after its
+        # retries during the last search_all(); their results are incomplete
+        self.failed_sources: set = set()
         self.pubmed_base = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/"
+        # A caller-supplied session (e.g. one shared by a web app) is left
+        # open by close(); otherwise this searcher owns its own.
+        self._owns_session = session is None
+        self.session = session if session is not None else self.create_session(use_cache)
+        self.api_key = api_key
+        self.eutils_limiter = _shared_eutils_limiter(api_key)
+        self.preprint_slots = _shared_host_slots("api.biorxiv.org", self.PREPRINT_WORKERS)
+
+    # On-disk cache settings (used only when requests-cache is installed).
+    # esearch hit lists change as PubMed indexes new papers, so they expire
+    # sooner than the preprint pages. esummary URLs carry the WebEnv of one
+    # esearch call, so they can only be hit while that esearch entry lives.
+    CACHE_NAME = ".pkd_cache"
+    CACHE_EXPIRE_AFTER = timedelta(days=1)
+    CACHE_URLS_EXPIRE_AFTER = {
+        "eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi": timedelta(hours=1),
+        "eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi": timedelta(hours=1),
+    }
+    # Preprint pages for a window that includes today still gain records
+    CACHE_OPEN_WINDOW_EXPIRE_AFTER = timedelta(hours=1)
+
+    @classmethod
+    def create_session(cls, use_cache: bool = True) -> requests.Session:
+        """Return a pooled HTTP session for a searcher's requests.
+
+        Keep-alive connections are reused across batches and pages. Failed
+        requests are not retried here; ``_get_json`` owns the retries. When
+        requests-cache is installed (and *use_cache* is true), successful
+        responses are also cached in a local SQLite file so repeat searches
+        over the same window skip the network.
+        """
+        if use_cache and requests_cache is not None:
+            session = requests_cache.CachedSession(
+                cache_name=cls.CACHE_NAME,
+                backend="sqlite",
+                expire_after=cls.CACHE_EXPIRE_AFTER,
+                urls_expire_after=cls.CACHE_URLS_EXPIRE_AFTER,
+                allowable_codes=(200,),
+                filter_fn=_cacheable_response,
+            )
+            # Drop stale entries (e.g. esummary pages of old WebEnvs);
+            # requests-cache < 1.0 names this remove_expired_responses()
+            try:
+                session.cache.delete(expired=True)
+            except TypeError:
+                session.remove_expired_responses()
+        else:
+            session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+        )
+        session.mount("https://", adapter)
+        session.headers["User-Agent"] = cls.USER_AGENT
+        session.headers["Accept-Encoding"] = "gzip"
+        return session
+
+    def close(self) -> None:
+        """Close the pooled HTTP connections, unless the session was passed in."""
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> "PKDLiteratureSearch":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def _retry_wait(error: Exception, attempt: int) -> float:
+        """Seconds to wait before retrying, honoring ``Retry-After`` on HTTP 429.
+
+        Falls back to exponential backoff (2s, 4s, 8s, ...).
+        """
+        response = getattr(error, "response", None)
+        if response is not None and response.status_code == 429:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return float(retry_after)
+        return 2.0 ** (attempt + 1)
+
+    def _get_json(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        label: str = "request",
+        limiter: Optional[_RateLimiter] = None,
+        max_retries: int = 3,
+        expire_after: Optional[timedelta] = None,
+    ) -> Optional[Dict]:
+        """GET *url* and decode its JSON body, retrying on failure.
+
+        Returns ``None`` once all *max_retries* attempts have failed. Safe to
+        call from worker threads; *limiter* spaces requests to one host.
+        *expire_after* overrides the cache lifetime of this response when
+        the session is a requests-cache session.
+        """
+        request_kwargs = {}
+        if (
+            expire_after is not None
+            and requests_cache is not None
+            and isinstance(self.session, requests_cache.CachedSession)
+        ):
+            request_kwargs["expire_after"] = expire_after
+        for attempt in range(max_retries):
+            try:
+                if limiter is not None:
+                    limiter.wait()
+                resp = self.session.get(url, params=params, timeout=30, **request_kwargs)
+                resp.raise_for_status()
+                return _json_loads(resp.content)
+            except Exception as e:
+                if attempt < max_retries - 1:
+                    wait_time = self._retry_wait(e, attempt)
+                    logger.warning("    Attempt %d failed for %s: %s", attempt + 1, label, e)
+                    logger.warning("    Retrying in %s seconds...", wait_time)
+                    time.sleep(wait_time)
+                else:
+                    logger.error("    %s failed after %d attempts: %s", label, max_retries, e)
+        return None
+
+    def _eutils_params(self, params: Dict) -> Dict:
+        """Add the NCBI API key (if configured) to E-utilities query params."""
+        if self.api_key:
+            return {**params, "api_key": self.api_key}
+        return params
 
     # ------------------------------------------------------------------
     # PubMed
     # ------------------------------------------------------------------
 
-    def search_pubmed(self) -> List[str]:
-        """Search PubMed for PKD papers and return a list of PMIDs."""
-        print(f"Searching PubMed for papers from {self.start_date} to {self.end_date}...")
+    def search_pubmed(self) -> Tuple[str, str, int]:
+        """Search PubMed for PKD papers on the E-utilities history server.
 
+        Returns ``(webenv, query_key, count)`` identifying the stored result
+        set, which ``get_pubmed_metadata`` pages through. *count* is 0 when
+        nothing was found or the search failed.
+        """
+        logger.info("Searching PubMed for papers from %s to %s...", self.start_date, self.end_date)
+
+        # Field-tagged so PubMed does the relevance filtering: the MeSH term
+        # (which includes ADPKD/ARPKD) covers indexed papers, and the
+        # title/abstract terms catch recent ones not yet MeSH-indexed.
         query = (
-            '("polycystic kidney" OR "polycystic kidney disease" '
-            'OR "ADPKD" OR "ARPKD" OR PKD1 OR PKD2)'
+            '("Polycystic Kidney Diseases"[MeSH Terms] '
+            'OR "polycystic kidney"[Title/Abstract] '
+            'OR ADPKD[Title/Abstract] OR ARPKD[Title/Abstract] '
+            'OR PKD1[Title/Abstract] OR PKD2[Title/Abstract])'
         )
 
         params = {
             "db": "pubmed",
             "term": query,
-            "retmax": 1000,
+            # PMIDs stay on the history server; esummary reads them by page
+            "retmax": 0,
+            "usehistory": "y",
             "retmode": "json",
             "datetype": "pdat",
             "mindate": self.start_date.replace("-", "/"),
             "maxdate": self.end_date.replace("-", "/"),
         }
 
-        try:
-            response = requests.get(
-                f"{self.pubmed_base}esearch.fcgi", params=params, timeout=30
-            )
-            response.raise_for_status()
-            data = response.json()
-            pmids = data.get("esearchresult", {}).get("idlist", [])
-            print(f"  Found {len(pmids)} papers in PubMed")
-            return pmids
-        except Exception as e:
-            print(f"  Error searching PubMed: {e}")
+        data = self._get_json(
+            f"{self.pubmed_base}esearch.fcgi",
+            params=self._eutils_params(params),
+            label="PubMed search",
+            limiter=self.eutils_limiter,
+        )
+        error = "no response" if data is None else _esearch_error(data)
+        if error:
+            logger.error("  Error searching PubMed: %s", error)
+            self.failed_sources.add("PubMed")
+            return "", "", 0
+
+        result = data.get("esearchresult", {})
+        count = min(int(result.get("count", 0)), self.PUBMED_MAX_RESULTS)
+        logger.info("  Found %d papers in PubMed", count)
+        return result.get("webenv", ""), result.get("querykey", ""), count
+
+    def _fetch_pubmed_batch(
+        self, webenv: str, query_key: str, retstart: int, retmax: int, label: str
+    ) -> List[Paper]:
+        """Fetch and parse esummary metadata for one page of a stored search."""
+        summary_params = {
+            "db": "pubmed",
+            "WebEnv": webenv,
+            "query_key": query_key,
+            "retstart": retstart,
+            "retmax": retmax,
+            "retmode": "json",
+        }
+        summary_data = self._get_json(
+            f"{self.pubmed_base}esummary.fcgi",
+            params=self._eutils_params(summary_params),
+            label=label,
+            limiter=self.eutils_limiter,
+        )
+        error = "no response" if summary_data is None else _esummary_error(summary_data)
+        if error:
+            logger.error("    %s failed: %s", label, error)
+            self.failed_sources.add("PubMed")
             return []
 
+        metadata: List[Paper] = []
+        result = summary_data.get("result", {})
+        for pmid in result.get("uids", []):
+            if pmid in result:
+                article = result[pmid]
+                all_authors = [
+                    name for name in (a.get("name", "").strip() for a in article.get("authors", []))
+                    if name
+                ]
+                authors_string = ", ".join(all_authors[: self.MAX_AUTHORS])
+                if len(all_authors) > self.MAX_AUTHORS:
+                    authors_string += " et al."
+                last_name_parts = all_authors[-1].split() if all_authors else []
+
+                metadata.append(Paper(
+                    pmid=pmid,
+                    title=article.get("title", ""),
+                    authors=authors_string,
+                    _last_author=last_name_parts[0] if last_name_parts else "",
+                    journal=article.get("source", ""),
+                    year=(
+                        article.get("pubdate", "").split()[0]
+                        if article.get("pubdate")
+                        else ""
+                    ),
+                    doi=next(
+                        (
+                            aid["value"]
+                            for aid in article.get("articleids", [])
+                            if aid.get("idtype") == "doi"
+                        ),
+                        "",
+                    ),
+                    source="PubMed",
+                ))
+
+        logger.info("    %s completed successfully", label)
+        return metadata
+
     def get_pubmed_metadata(
-        self, pmids: List[str], batch_size: int = 100
-    ) -> List[Dict]:
-        """Retrieve metadata for PubMed articles in batches with retry logic."""
-        print(f"Retrieving metadata for {len(pmids)} PubMed articles...")
-        all_metadata: List[Dict] = []
-
-        for i in range(0, len(pmids), batch_size):
-            batch = pmids[i : i + batch_size]
-            batch_num = (i // batch_size) + 1
-            total_batches = (len(pmids) + batch_size - 1) // batch_size
-            print(f"  Processing batch {batch_num}/{total_batches} ({len(batch)} PMIDs)...")
-
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    summary_params = {
-                        "db": "pubmed",
-                        "id": ",".join(batch),
-                        "retmode": "json",
-                    }
-                    resp = requests.get(
-                        f"{self.pubmed_base}esummary.fcgi",
-                        params=summary_params,
-                        timeout=30,
-                    )
-                    resp.raise_for_status()
-                    summary_data = resp.json()
-
-                    for pmid in batch:
-                        if pmid in summary_data.get("result", {}):
-                            article = summary_data["result"][pmid]
-                            all_authors = [
-                                a.get("name", "") for a in article.get("authors", [])
-                            ]
-                            authors_string = ", ".join(all_authors) if all_authors else ""
-
-                            metadata = {
-                                "pmid": pmid,
-                                "title": article.get("title", ""),
-                                "authors": authors_string,
-                                "journal": article.get("source", ""),
-                                "year": (
-                                    article.get("pubdate", "").split()[0]
-                                    if article.get("pubdate")
-                                    else ""
-                                ),
-                                "doi": next(
-                                    (
-                                        aid["value"]
-                                        for aid in article.get("articleids", [])
-                                        if aid.get("idtype") == "doi"
-                                    ),
-                                    "",
-                                ),
-                                "source": "PubMed",
-                            }
-                            all_metadata.append(metadata)
-
-                    print(f"    Batch {batch_num} completed successfully")
-                    break
-                except Exception as e:
-                    if attempt < max_retries - 1:
-                        wait_time = (attempt + 1) * 2
-                        print(f"    Attempt {attempt + 1} failed: {e}")
-                        print(f"    Retrying in {wait_time} seconds...")
-                        time.sleep(wait_time)
-                    else:
-                        print(
-                            f"    Batch {batch_num} failed after {max_retries} attempts: {e}"
-                        )
+        self, webenv: str, query_key: str, count: int
+    ) -> List[Paper]:
+        """Retrieve metadata for a stored PubMed search in pages with retry logic.
 
-            time.sleep(0.5)
+        Pages of ``PUBMED_PAGE_SIZE`` records are fetched concurrently
+        (``PUBMED_WORKERS`` at a time) while the shared rate limiter keeps the
+        request rate within NCBI's limits.
+        """
+        logger.info("Retrieving metadata for %d PubMed articles...", count)
+        page_size = self.PUBMED_PAGE_SIZE
+        starts = list(range(0, count, page_size))
+        sizes = [min(page_size, count - start) for start in starts]
+        labels = [
+            f"Batch {num}/{len(starts)} ({size} PMIDs)"
+            for num, size in enumerate(sizes, 1)
+        ]
 
-        print(f"  Successfully retrieved metadata for {len(all_metadata)} articles")
+        with ThreadPoolExecutor(max_workers=self.PUBMED_WORKERS) as executor:
+            results = list(executor.map(
+                self._fetch_pubmed_batch,
+                [webenv] * len(starts),
+                [query_key] * len(starts),
+                starts,
+                sizes,
+                labels,
+            ))
+
+        all_metadata = [paper for batch_papers in results for paper in batch_papers]
+        logger.info("  Successfully retrieved metadata for %d articles", len(all_metadata))
         return all_metadata
 
     # ------------------------------------------------------------------
@@ -184,44 +586,63 @@ class PKDLiteratureSearch:
         text = (title + " " + abstract).lower()
         return any(kw in text for kw in self.PKD_KEYWORDS)
 
-    def _search_preprint_server(self, server: str) -> List[Dict]:
-        """Search bioRxiv or medRxiv for PKD preprints via the public API."""
-        base_url = f"https://api.biorxiv.org/details/{server}"
-        papers: List[Dict] = []
-        cursor = 0
-        page_size = 100
-        seen_dois: set = set()
+    def _fetch_preprint_page(self, server: str, cursor: int) -> Optional[Dict]:
+        # A window reaching today changes through the day, so its pages
+        # (including the cursor-0 total) are cached as briefly as esearch
+        open_window = self.end_date >= date.today().isoformat()
+        with self.preprint_slots:
+            return self._get_json(
+                f"https://api.biorxiv.org/details/{server}/{self.start_date}/{self.end_date}/{cursor}",
+                label=f"{server} page at cursor {cursor}",
+                expire_after=self.CACHE_OPEN_WINDOW_EXPIRE_AFTER if open_window else None,
+            )
 
-        while True:
-            url = f"{base_url}/{self.start_date}/{self.end_date}/{cursor}"
+    def _search_preprint_servers(self, servers: Tuple[str, ...]) -> Dict[str, List[Paper]]:
+        """Search bioRxiv and/or medRxiv for PKD preprints via the public API.
 
-            max_retries = 3
-            data = None
-            for attempt in range(max_retries):
-                try:
-                    resp = requests.get(url, timeout=30)
-                    resp.raise_for_status()
-                    data = resp.json()
-                    break
-                except Exception as e:
-                    if attempt < max_retries - 1:
-                        wait_time = (attempt + 1) * 2
-                        print(f"    Attempt {attempt + 1} failed at cursor {cursor}: {e}")
-                        print(f"    Retrying in {wait_time} seconds...")
-                        time.sleep(wait_time)
-                    else:
-                        print(
-                            f"    API error at cursor {cursor} after {max_retries} attempts: {e}"
-                        )
+        Both servers live on api.biorxiv.org, so they share one thread pool
+        of ``PREPRINT_WORKERS`` (the per-host limit) and the session's
+        connection pool.
+        The first pages are fetched together to learn each server's total
+        record count, then every remaining page of every server is fetched
+        in one concurrent batch.
+        """
+        page_size = 100
 
-            if data is None:
-                break
+        with ThreadPoolExecutor(max_workers=self.PREPRINT_WORKERS) as executor:
+            first_pages = list(executor.map(self._fetch_preprint_page, servers, [0] * len(servers)))
+
+            pages: Dict[str, List[Optional[Dict]]] = {}
+            jobs: List[Tuple[str, int]] = []
+            for server, first_page in zip(servers, first_pages):
+                if first_page is None:
+                    self.failed_sources.add(server)
+                    continue
+                pages[server] = [first_page]
+                total_msg = first_page.get("messages", [{}])[0]
+                total_count = int(total_msg.get("total", 0)) if total_msg else 0
+                jobs.extend((server, cursor) for cursor in range(page_size, total_count, page_size))
+
+            rest = executor.map(
+                self._fetch_preprint_page,
+                [server for server, _ in jobs],
+                [cursor for _, cursor in jobs],
+            )
+            for (server, _), page in zip(jobs, rest):
+                if page is None:
+                    self.failed_sources.add(server)
+                pages[server].append(page)
 
-            collection = data.get("collection", [])
-            if not collection:
-                break
+        return {server: self._parse_preprint_pages(server, pages.get(server, [])) for server in servers}
 
-            for item in collection:
+    def _parse_preprint_pages(self, server: str, pages: List[Optional[Dict]]) -> List[Paper]:
+        """PKD-relevant records from one server's pages, deduplicated by DOI."""
+        papers: List[Paper] = []
+        seen_dois: set = set()
+        for data in pages:
+            if data is None:
+                continue
+            for item in data.get("collection", []):
                 title = item.get("title", "")
                 abstract = item.get("abstract", "")
                 doi = item.get("doi", "")
@@ -232,45 +653,60 @@ class PKDLiteratureSearch:
                         seen_dois.add(doi)
 
                     papers.append(
-                        {
-                            "pmid": "",
-                            "title": title,
-                            "authors": item.get("authors", ""),
-                            "journal": f"{server} (preprint)",
-                            "year": item.get("date", "")[:4],
-                            "doi": doi,
-                            "source": server,
-                        }
+                        Paper(
+                            pmid="",
+                            title=title,
+                            authors=item.get("authors", ""),
+                            journal=f"{server} (preprint)",
+                            year=item.get("date", "")[:4],
+                            doi=doi,
+                            source=server,
+                        )
                     )
 
-            total_msg = data.get("messages", [{}])[0]
-            total_count = int(total_msg.get("total", 0)) if total_msg else 0
-            cursor += page_size
-            if cursor >= total_count:
-                break
-
-            time.sleep(0.3)
-
         return papers
 
-    def search_biorxiv(self) -> List[Dict]:
-        print(f"Searching bioRxiv for preprints from {self.start_date} to {self.end_date}...")
-        papers = self._search_preprint_server("biorxiv")
-        print(f"  Found {len(papers)} PKD-relevant preprints in bioRxiv")
+    def search_biorxiv(self) -> List[Paper]:
+        logger.info("Searching bioRxiv for preprints from %s to %s...", self.start_date, self.end_date)
+        papers = self._search_preprint_servers(("biorxiv",))["biorxiv"]
+        logger.info("  Found %d PKD-relevant preprints in bioRxiv", len(papers))
         return papers
 
-    def search_medrxiv(self) -> List[Dict]:
-        print(f"Searching medRxiv for preprints from {self.start_date} to {self.end_date}...")
-        papers = self._search_preprint_server("medrxiv")
-        print(f"  Found {len(papers)} PKD-relevant preprints in medRxiv")
+    def search_medrxiv(self) -> List[Paper]:
+        logger.info("Searching medRxiv for preprints from %s to %s...", self.start_date, self.end_date)
+        papers = self._search_preprint_servers(("medrxiv",))["medrxiv"]
+        logger.info("  Found %d PKD-relevant preprints in medRxiv", len(papers))
         return papers
 
+    def _search_preprints_all(self) -> Tuple[List[Paper], List[Paper]]:
+        """Search bioRxiv and medRxiv together; returns (biorxiv, medrxiv)."""
+        logger.info(
+            "Searching bioRxiv and medRxiv for preprints from %s to %s...",
+            self.start_date, self.end_date,
+        )
+        results = self._search_preprint_servers(("biorxiv", "medrxiv"))
+        logger.info("  Found %d PKD-relevant preprints in bioRxiv", len(results["biorxiv"]))
+        logger.info("  Found %d PKD-relevant preprints in medRxiv", len(results["medrxiv"]))
+        return results["biorxiv"], results["medrxiv"]
+
     # ------------------------------------------------------------------
     # Categorisation helpers
     # ------------------------------------------------------------------
 
-    def categorize_papers(self, papers: List[Dict]) -> Dict[str, List[Dict]]:
-        categories: Dict[str, List[Dict]] = {
+    # Checked in order; a paper goes into the first category with a keyword
+    # in its lowercased title, or "other" if none match.
+    _CATEGORY_RULES = (
+        ("genetics", ("genetic", "mutation", "variant", "sequencing", "gene")),
+        ("therapeutics", ("drug", "therapeutic", "treatment", "inhibitor", "trial")),
+        ("metabolism", ("metabol", "mitochondr", "cholesterol", "amino acid")),
+        ("cross_species", ("mouse", "mice", "rat", "model", "crispr")),
+        ("dataset", ("cohort", "registry", "dataset", "population")),
+        ("pathophysiology", ("pathophysiology", "mechanism", "pathway")),
+        ("clinical", ("patient", "clinical", "case")),
+    )
+
+    def categorize_papers(self, papers: List[Paper]) -> Dict[str, List[Paper]]:
+        categories: Dict[str, List[Paper]] = {
             "genetics": [],
             "therapeutics": [],
             "metabolism": [],
@@ -282,21 +718,11 @@ class PKDLiteratureSearch:
         }
 
         for paper in papers:
-            t = paper.get("title", "").lower()
-            if any(w in t for w in ["genetic", "mutation", "variant", "sequencing", "gene"]):
-                categories["genetics"].append(paper)
-            elif any(w in t for w in ["drug", "therapeutic", "treatment", "inhibitor", "trial"]):
-                categories["therapeutics"].append(paper)
-            elif any(w in t for w in ["metabol", "mitochondr", "cholesterol", "amino acid"]):
-                categories["metabolism"].append(paper)
-            elif any(w in t for w in ["mouse", "mice", "rat", "model", "crispr"]):
-                categories["cross_species"].append(paper)
-            elif any(w in t for w in ["cohort", "registry", "dataset", "population"]):
-                categories["dataset"].append(paper)
-            elif any(w in t for w in ["pathophysiology", "mechanism", "pathway"]):
-                categories["pathophysiology"].append(paper)
-            elif any(w in t for w in ["patient", "clinical", "case"]):
-                categories["clinical"].append(paper)
+            t = paper.title.lower()
+            for category, keywords in self._CATEGORY_RULES:
+                if any(kw in t for kw in keywords):
+                    categories[category].append(paper)
+                    break
             else:
                 categories["other"].append(paper)
 
@@ -346,9 +772,9 @@ class PKDLiteratureSearch:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _paper_link(paper: Dict) -> str:
-        doi = paper.get("doi", "")
-        pmid = paper.get("pmid", "")
+    def _paper_link(paper: Paper) -> str:
+        doi = paper.doi
+        pmid = paper.pmid
         if doi:
             return f"https://doi.org/{doi}"
         if pmid:
@@ -356,81 +782,185 @@ class PKDLiteratureSearch:
         return ""
 
     @staticmethod
-    def _paper_link_label(paper: Dict) -> str:
-        doi = paper.get("doi", "")
-        pmid = paper.get("pmid", "")
-        link = PKDLiteratureSearch._paper_link(paper)
+    def _paper_link_label(paper: Paper) -> str:
+        doi = paper.doi
+        pmid = paper.pmid
+        link = _escape_attr(PKDLiteratureSearch._paper_link(paper))
         if not link:
             return ""
         if pmid:
-            return f'<link href="{link}" color="blue">PMID: {pmid}</link>'
+            return f'<link href="{link}" color="blue">PMID: {escape(pmid)}</link>'
         if doi:
-            return f'<link href="{link}" color="blue">DOI: {doi}</link>'
+            return f'<link href="{link}" color="blue">DOI: {escape(doi)}</link>'
         return ""
 
+    @staticmethod
+    def _paper_entry_markup(index: int, paper: Paper) -> Tuple[str, str]:
+        """ReportLab markup for one entry of the complete paper list.
+
+        Returns ``(title, citation)``; the citation and links share one
+        indented Paragraph, so each paper costs two markup parses. Paper
+        text is escaped since titles and author lists can contain ``&`` or
+        ``<``.
+        """
+        link_parts = []
+        pmid = paper.pmid
+        if pmid:
+            link_parts.append(
+                f'<link href="{_escape_attr(f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/")}" color="blue">'
+                f"PMID: {escape(pmid)}</link>"
+            )
+        doi = paper.doi
+        if doi:
+            link_parts.append(
+                f'<link href="{_escape_attr(f"https://doi.org/{doi}")}" color="blue">'
+                f"DOI: {escape(doi)}</link>"
+            )
+        return (
+            f"<b>{index}. {escape(paper.title)}</b>",
+            f"{escape(paper.authors)}. <i>{escape(paper.journal)}</i>. {escape(paper.year)}."
+            f'<br/>{" | ".join(link_parts)}',
+        )
+
+    # ------------------------------------------------------------------
+    # Derived report fields
+    # ------------------------------------------------------------------
+
+    def _enrich(self, paper: Paper) -> Paper:
+        """Store the fields the Excel and PDF builders derive from *paper*.
+
+        Computed once per paper (in ``search_all``) so every report reuses
+        them instead of re-splitting titles and rebuilding links.
+        """
+        title = paper.title
+        paper._summary = self.create_summary(title, max_words=7)
+        paper._key_findings = self.create_key_findings(title, max_words=20)
+        if paper._last_author is None:  # PubMed records set it from the author list
+            paper._last_author = self.extract_last_author_name(paper.authors)
+        paper._link = self._paper_link(paper)
+        paper._link_label = self._paper_link_label(paper)
+        return paper
+
+    def _enriched(self, paper: Paper) -> Paper:
+        """Return *paper* if already enriched, else an enriched copy."""
+        return paper if paper._link is not None else self._enrich(dataclasses.replace(paper))
+
     # ------------------------------------------------------------------
     # Excel report  (file *or* BytesIO)
     # ------------------------------------------------------------------
 
-    def _build_excel_workbook(self, papers: List[Dict]) -> openpyxl.Workbook:
-        """Build an openpyxl Workbook entirely in memory."""
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "PKD Literature"
-
-        ws.column_dimensions["A"].width = 5
-        ws.column_dimensions["B"].width = 5
-        ws.column_dimensions["C"].width = 5
-        ws.column_dimensions["D"].width = 35
-        ws.column_dimensions["E"].width = 15
-        ws.column_dimensions["F"].width = 25
-        ws.column_dimensions["G"].width = 60
-        ws.column_dimensions["H"].width = 5
-        ws.column_dimensions["I"].width = 5
-        ws.column_dimensions["J"].width = 45
-
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF", size=11)
-        header_alignment = Alignment(horizontal="center", vertical="center")
-
-        headers = ["", "", "", "Summary", "Last Author", "Journal", "Key Findings", "", "", "Link"]
-        for col_num, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_num)
-            cell.value = header
+    EXCEL_HEADERS = ["", "", "", "Summary", "Last Author", "Journal", "Key Findings", "", "", "Link"]
+    EXCEL_COLUMN_WIDTHS = [5, 5, 5, 35, 15, 25, 60, 5, 5, 45]
+
+    def _build_excel_workbook(self, papers: List[Paper]) -> "openpyxl.Workbook":
+        """Build an openpyxl Workbook in write-only mode.
+
+        Rows are appended in order and serialized on save, which avoids the
+        per-cell random-access overhead of a regular worksheet.
+        """
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("PKD Literature")
+
+        # Write-only sheets need column widths before the first row
+        for col_num, width in enumerate(self.EXCEL_COLUMN_WIDTHS, 1):
+            ws.column_dimensions[get_column_letter(col_num)].width = width
+
+        header_style = NamedStyle(
+            name="pkd_header",
+            font=Font(bold=True, color="FFFFFF", size=11),
+            fill=PatternFill(start_color="366092", end_color="366092", fill_type="solid"),
+            alignment=Alignment(horizontal="center", vertical="center"),
+        )
+        link_style = NamedStyle(
+            name="pkd_link", font=Font(color="0563C1", underline="single")
+        )
+        wb.add_named_style(header_style)
+        wb.add_named_style(link_style)
+
+        header_row = []
+        for header in self.EXCEL_HEADERS:
+            cell = WriteOnlyCell(ws, value=header or None)
             if header:
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.alignment = header_alignment
-
-        for idx, paper in enumerate(papers, start=2):
-            ws.cell(row=idx, column=4, value=self.create_summary(paper.get("title", ""), max_words=7))
-            ws.cell(row=idx, column=5, value=self.extract_last_author_name(paper.get("authors", "")))
-            ws.cell(row=idx, column=6, value=paper.get("journal", ""))
-            ws.cell(row=idx, column=7, value=self.create_key_findings(paper.get("title", ""), max_words=20))
-
-            doi = paper.get("doi", "")
-            pmid = paper.get("pmid", "")
-            link = f"https://doi.org/{doi}" if doi else (f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/" if pmid else "")
+                cell.style = header_style.name
+            header_row.append(cell)
+        ws.append(header_row)
+
+        for paper in map(self._enriched, papers):
+            link = paper._link
+            link_cell = None
             if link:
-                link_cell = ws.cell(row=idx, column=10)
-                link_cell.value = link
+                link_cell = WriteOnlyCell(ws, value=link)
                 link_cell.hyperlink = link
-                link_cell.font = Font(color="0563C1", underline="single")
+                link_cell.style = link_style.name
+
+            ws.append([
+                None, None, None,
+                paper._summary,
+                paper._last_author,
+                paper.journal,
+                paper._key_findings,
+                None, None,
+                link_cell,
+            ])
 
         return wb
 
-    def create_excel_report(self, papers: List[Dict], filename: str) -> None:
+    def _write_excel_xlsxwriter(self, papers: List[Paper], target) -> None:
+        """Write the Excel report with xlsxwriter in constant-memory mode.
+
+        Rows are flushed as they are written, so memory stays flat regardless
+        of the number of papers. *target* is a filename or a file-like object.
+        """
+        wb = xlsxwriter.Workbook(target, {"constant_memory": True})
+        ws = wb.add_worksheet("PKD Literature")
+
+        for col, width in enumerate(self.EXCEL_COLUMN_WIDTHS):
+            ws.set_column(col, col, width)
+
+        header_fmt = wb.add_format({
+            "bold": True, "font_color": "#FFFFFF", "font_size": 11,
+            "bg_color": "#366092", "align": "center", "valign": "vcenter",
+        })
+        link_fmt = wb.add_format({"font_color": "#0563C1", "underline": 1})
+
+        for col, header in enumerate(self.EXCEL_HEADERS):
+            if header:
+                ws.write_string(0, col, header, header_fmt)
+
+        for row, paper in enumerate(map(self._enriched, papers), start=1):
+            ws.write_string(row, 3, paper._summary)
+            ws.write_string(row, 4, paper._last_author)
+            ws.write_string(row, 5, paper.journal)
+            ws.write_string(row, 6, paper._key_findings)
+
+            link = paper._link
+            if link:
+                ws.write_url(row, 9, link, link_fmt, link)
+
+        wb.close()
+
+    def _write_excel(self, papers: List[Paper], target) -> None:
+        """Write the Excel report to *target* (a filename or file-like object).
+
+        Uses xlsxwriter when it is installed and falls back to openpyxl.
+        """
+        if xlsxwriter is not None:
+            self._write_excel_xlsxwriter(papers, target)
+        elif openpyxl is not None:
+            self._build_excel_workbook(papers).save(target)
+        else:
+            raise ImportError("Excel reports require xlsxwriter (or openpyxl) to be installed")
+
+    def create_excel_report(self, papers: List[Paper], filename: str) -> None:
         """Write Excel report to *filename* on disk."""
-        print(f"Creating Excel report: {filename}...")
-        wb = self._build_excel_workbook(papers)
-        wb.save(filename)
-        print(f"  Excel report saved: {filename}")
+        logger.info("Creating Excel report: %s...", filename)
+        self._write_excel(papers, filename)
+        logger.info("  Excel report saved: %s", filename)
 
-    def create_excel_bytes(self, papers: List[Dict]) -> bytes:
+    def create_excel_bytes(self, papers: List[Paper]) -> bytes:
         """Return the Excel report as raw bytes (for Streamlit downloads)."""
-        wb = self._build_excel_workbook(papers)
         buf = io.BytesIO()
-        wb.save(buf)
+        self._write_excel(papers, buf)
         return buf.getvalue()
 
     # ------------------------------------------------------------------
@@ -439,7 +969,7 @@ class PKDLiteratureSearch:
 
     def _build_pdf_story(
         self,
-        papers: List[Dict],
+        papers: List[Paper],
         categories: Dict,
         pubmed_count: int,
         biorxiv_count: int,
@@ -447,33 +977,15 @@ class PKDLiteratureSearch:
     ) -> list:
         """Return the list of ReportLab flowables for the PDF."""
         story = []
-        styles = getSampleStyleSheet()
-
-        title_style = ParagraphStyle(
-            "CustomTitle", parent=styles["Heading1"], fontSize=18,
-            textColor=colors.HexColor("#1f4788"), spaceAfter=30, alignment=TA_CENTER,
-        )
-        heading1_style = ParagraphStyle(
-            "CustomHeading1", parent=styles["Heading1"], fontSize=14,
-            textColor=colors.HexColor("#1f4788"), spaceAfter=12, spaceBefore=12,
-            borderWidth=1, borderColor=colors.HexColor("#1f4788"), borderPadding=5,
-        )
-        heading2_style = ParagraphStyle(
-            "CustomHeading2", parent=styles["Heading2"], fontSize=12,
-            textColor=colors.HexColor("#2E5C8A"), spaceAfter=10, spaceBefore=10,
-        )
-        body_style = ParagraphStyle(
-            "CustomBody", parent=styles["Normal"], fontSize=10, leading=14,
-            alignment=TA_JUSTIFY,
-        )
-        citation_style = ParagraphStyle(
-            "Citation", parent=styles["Normal"], fontSize=9, leftIndent=20,
-            textColor=colors.HexColor("#444444"), leading=12, spaceAfter=8,
-        )
+        title_style = _PDF_STYLES["title"]
+        heading1_style = _PDF_STYLES["h1"]
+        heading2_style = _PDF_STYLES["h2"]
+        body_style = _PDF_STYLES["body"]
+        citation_style = _PDF_STYLES["citation"]
 
         # Title
         story.append(Paragraph("POLYCYSTIC KIDNEY DISEASE LITERATURE REVIEW", title_style))
-        story.append(Paragraph(f"Search Period: {self.start_date} to {self.end_date}", styles["Normal"]))
+        story.append(Paragraph(f"Search Period: {self.start_date} to {self.end_date}", _PDF_STYLES["normal"]))
         story.append(Spacer(1, 20))
 
         # Summary table
@@ -486,16 +998,7 @@ class PKDLiteratureSearch:
             ["Date Range:", f"{self.start_date} to {self.end_date}"],
         ]
         t = Table(summary_data, colWidths=[2.5 * inch, 3 * inch])
-        t.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (0, -1), colors.HexColor("#E8EFF7")),
-            ("TEXTCOLOR", (0, 0), (-1, -1), colors.black),
-            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-            ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
-            ("FONTSIZE", (0, 0), (-1, -1), 10),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
-            ("TOPPADDING", (0, 0), (-1, -1), 8),
-            ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-        ]))
+        t.setStyle(_SUMMARY_TABLE_STYLE)
         story.append(t)
         story.append(Spacer(1, 20))
 
@@ -512,11 +1015,11 @@ class PKDLiteratureSearch:
         for key, label, limit in section_map:
             if categories.get(key):
                 story.append(Paragraph(label, heading2_style))
-                for paper in categories[key][:limit]:
-                    story.append(Paragraph(f"&bull; {paper['title']}", body_style))
+                for paper in map(self._enriched, categories[key][:limit]):
+                    story.append(Paragraph(f"&bull; {escape(paper.title)}", body_style))
                     citation = (
-                        f'<b>Citation:</b> {paper["authors"]}. '
-                        f"{self._paper_link_label(paper)}"
+                        f'<b>Citation:</b> {escape(paper.authors)}. '
+                        f'{paper._link_label}'
                     )
                     story.append(Paragraph(citation, citation_style))
                 story.append(Spacer(1, 15))
@@ -527,33 +1030,30 @@ class PKDLiteratureSearch:
         story.append(Paragraph(f"COMPLETE PAPER LIST ({len(papers)} PAPERS)", heading1_style))
         story.append(Spacer(1, 15))
 
+        entry_citation_style = _PDF_STYLES["entry_citation"]
         for i, paper in enumerate(papers, 1):
-            story.append(Paragraph(f'<b>{i}. {paper["title"]}</b>', body_style))
-            story.append(
-                Paragraph(
-                    f'{paper["authors"]}. <i>{paper["journal"]}</i>. {paper["year"]}.',
-                    citation_style,
-                )
-            )
-            link_parts = []
-            if paper.get("pmid"):
-                link_parts.append(
-                    f'<link href="https://pubmed.ncbi.nlm.nih.gov/{paper["pmid"]}/" color="blue">'
-                    f'PMID: {paper["pmid"]}</link>'
-                )
-            if paper.get("doi"):
-                link_parts.append(
-                    f'<link href="https://doi.org/{paper["doi"]}" color="blue">'
-                    f'DOI: {paper["doi"]}</link>'
-                )
-            story.append(Paragraph(" | ".join(link_parts), citation_style))
-            story.append(Spacer(1, 10))
+            title_markup, citation_markup = self._paper_entry_markup(i, paper)
+            story.append(Paragraph(title_markup, body_style))
+            story.append(Paragraph(citation_markup, entry_citation_style))
 
         return story
 
+    @staticmethod
+    def _pdf_doc_template(target) -> SimpleDocTemplate:
+        """Document template for *target* (a filename or file-like object).
+
+        Page content streams are zlib-compressed, and ``invariant`` drops
+        the per-run timestamp/ID so identical inputs give identical bytes.
+        """
+        return SimpleDocTemplate(
+            target, pagesize=letter,
+            rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18,
+            pageCompression=1, invariant=1, allowSplitting=1,
+        )
+
     def create_pdf_report(
         self,
-        papers: List[Dict],
+        papers: List[Paper],
         categories: Dict,
         filename: str,
         pubmed_count: int = 0,
@@ -561,18 +1061,15 @@ class PKDLiteratureSearch:
         medrxiv_count: int = 0,
     ) -> None:
         """Write PDF report to *filename* on disk."""
-        print(f"Creating PDF report: {filename}...")
-        doc = SimpleDocTemplate(
-            filename, pagesize=letter,
-            rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18,
-        )
+        logger.info("Creating PDF report: %s...", filename)
+        doc = self._pdf_doc_template(filename)
         story = self._build_pdf_story(papers, categories, pubmed_count, biorxiv_count, medrxiv_count)
         doc.build(story)
-        print(f"  PDF report saved: {filename}")
+        logger.info("  PDF report saved: %s", filename)
 
     def create_pdf_bytes(
         self,
-        papers: List[Dict],
+        papers: List[Paper],
         categories: Dict,
         pubmed_count: int = 0,
         biorxiv_count: int = 0,
@@ -580,26 +1077,66 @@ class PKDLiteratureSearch:
     ) -> bytes:
         """Return the PDF report as raw bytes (for Streamlit downloads)."""
         buf = io.BytesIO()
-        doc = SimpleDocTemplate(
-            buf, pagesize=letter,
-            rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18,
-        )
+        doc = self._pdf_doc_template(buf)
         story = self._build_pdf_story(papers, categories, pubmed_count, biorxiv_count, medrxiv_count)
         doc.build(story)
         return buf.getvalue()
 
+    def build_reports_bytes(
+        self,
+        papers: List[Paper],
+        categories: Dict,
+        pubmed_count: int = 0,
+        biorxiv_count: int = 0,
+        medrxiv_count: int = 0,
+    ) -> Tuple[bytes, bytes]:
+        """Return ``(excel_bytes, pdf_bytes)``, built in parallel worker processes.
+
+        Both writers are pure Python and CPU-bound, so separate processes
+        let them run side by side without holding the caller's GIL. Small
+        paper sets, or single-CPU hosts, are built in-process instead, where
+        starting the workers would cost more than it saves.
+        """
+        if len(papers) < self.REPORT_PROCESS_MIN_PAPERS or (os.cpu_count() or 1) < 2:
+            return (
+                self.create_excel_bytes(papers),
+                self.create_pdf_bytes(
+                    papers,
+                    categories,
+                    pubmed_count=pubmed_count,
+                    biorxiv_count=biorxiv_count,
+                    medrxiv_count=medrxiv_count,
+                ),
+            )
+
+        # "spawn" rather than fork: callers such as Streamlit are multi-threaded
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=2, mp_context=context) as executor:
+            excel_future = executor.submit(_build_excel_worker, papers)
+            pdf_future = executor.submit(
+                _build_pdf_worker,
+                self.start_date,
+                self.end_date,
+                papers,
+                categories,
+                pubmed_count,
+                biorxiv_count,
+                medrxiv_count,
+            )
+            return excel_future.result(), pdf_future.result()
+
     # ------------------------------------------------------------------
     # Deduplication
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _deduplicate_papers(papers: List[Dict]) -> List[Dict]:
+    def _deduplicate_papers(papers: List[Paper]) -> List[Paper]:
         seen_dois: set = set()
         seen_titles: set = set()
-        unique: List[Dict] = []
+        unique: List[Paper] = []
         for paper in papers:
-            doi = paper.get("doi", "").strip().lower()
-            title = paper.get("title", "").strip().lower()
+            doi = paper.doi.strip().lower()
+            title = paper.title.strip().lower()
             if doi and doi in seen_dois:
                 continue
             if title and title in seen_titles:
@@ -615,33 +1152,59 @@ class PKDLiteratureSearch:
     # High-level search  (returns structured results)
     # ------------------------------------------------------------------
 
+    def _pubmed_pipeline(self) -> List[Paper]:
+        """Search PubMed and fetch metadata for every matching PMID."""
+        webenv, query_key, count = self.search_pubmed()
+        return self.get_pubmed_metadata(webenv, query_key, count) if count else []
+
     def search_all(
-        self,
-    ) -> Tuple[List[Dict], List[Dict], List[Dict], List[Dict], Dict[str, List[Dict]]]:
-        """Run all searches and return (all_papers, pubmed, biorxiv, medrxiv, categories).
+        self, max_workers: int = 2
+    ) -> Tuple[
+        List[Paper], List[Paper], List[Paper], List[Paper], Dict[str, List[Paper]], Dict[str, int]
+    ]:
+        """Run all searches and return
+        (all_papers, pubmed, biorxiv, medrxiv, categories, category_counts).
+
+        ``category_counts`` maps each category to its paper count so callers
+        that only display totals never need to hold the categorised lists.
+
+        Sources that could not be fully fetched are recorded in
+        ``failed_sources``; their lists may be empty or partial.
+
+        PubMed and the two preprint servers are independent and
+        network-bound, so the PubMed pipeline and the combined preprint
+        search run concurrently on a thread pool of *max_workers* threads.
 
         This is the primary entry-point for both the CLI ``run()`` method and
         the Streamlit app.
         """
-        self.all_papers = []
-
-        # PubMed
-        pmids = self.search_pubmed()
-        pubmed_papers = self.get_pubmed_metadata(pmids) if pmids else []
-        self.all_papers.extend(pubmed_papers)
+        self.failed_sources = set()
+        tasks = {
+            "pubmed": self._pubmed_pipeline,
+            "preprints": self._search_preprints_all,
+        }
+        results: Dict = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(task): name for name, task in tasks.items()}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
 
-        # bioRxiv & medRxiv
-        biorxiv_papers = self.search_biorxiv()
-        medrxiv_papers = self.search_medrxiv()
-        self.all_papers.extend(biorxiv_papers)
-        self.all_papers.extend(medrxiv_papers)
+        pubmed_papers = results["pubmed"]
+        biorxiv_papers, medrxiv_papers = results["preprints"]
 
-        # Deduplicate
+        # Merge in a fixed order so deduplication keeps the PubMed record
+        self.all_papers = pubmed_papers + biorxiv_papers + medrxiv_papers
         self.all_papers = self._deduplicate_papers(self.all_papers)
+        for paper in self.all_papers:
+            self._enrich(paper)
 
         categories = self.categorize_papers(self.all_papers)
+        category_counts = {cat: len(cat_papers) for cat, cat_papers in categories.items()}
 
-        return self.all_papers, pubmed_papers, biorxiv_papers, medrxiv_papers, categories
+        return (
+            self.all_papers, pubmed_papers, biorxiv_papers, medrxiv_papers,
+            categories, category_counts,
+        )
 
     # ------------------------------------------------------------------
     # CLI run
@@ -649,19 +1212,27 @@ class PKDLiteratureSearch:
 
     def run(self) -> None:
         """Execute the complete search and write reports to disk (CLI mode)."""
-        print("\n" + "=" * 80)
-        print("PKD LITERATURE SEARCH")
-        print("=" * 80 + "\n")
-
-        all_papers, pubmed_papers, biorxiv_papers, medrxiv_papers, categories = self.search_all()
-
-        print(f"\nTotal papers found: {len(all_papers)}")
-        print(f"  PubMed: {len(pubmed_papers)}")
-        print(f"  bioRxiv: {len(biorxiv_papers)}")
-        print(f"  medRxiv: {len(medrxiv_papers)}")
+        logger.info("\n%s", "=" * 80)
+        logger.info("PKD LITERATURE SEARCH")
+        logger.info("%s\n", "=" * 80)
+
+        (
+            all_papers, pubmed_papers, biorxiv_papers, medrxiv_papers,
+            categories, category_counts,
+        ) = self.search_all()
+
+        logger.info("\nTotal papers found: %d", len(all_papers))
+        logger.info("  PubMed: %d", len(pubmed_papers))
+        logger.info("  bioRxiv: %d", len(biorxiv_papers))
+        logger.info("  medRxiv: %d", len(medrxiv_papers))
+        if self.failed_sources:
+            logger.warning(
+                "Warning: results are incomplete; requests failed for %s",
+                ", ".join(sorted(self.failed_sources)),
+            )
 
         if not all_papers:
-            print("No papers found for this date range.")
+            logger.info("No papers found for this date range.")
             return
 
         end_fmt = self.end_date.replace("-", "")
@@ -676,13 +1247,13 @@ class PKDLiteratureSearch:
             medrxiv_count=len(medrxiv_papers),
         )
 
-        print("\n" + "=" * 80)
-        print("SEARCH COMPLETE")
-        print("=" * 80)
-        print(f"\nReports generated:")
-        print(f"  Excel: {excel_path}")
-        print(f"  PDF:   {pdf_path}")
-        print(f"\nTotal papers: {len(all_papers)}")
+        logger.info("\n%s", "=" * 80)
+        logger.info("SEARCH COMPLETE")
+        logger.info("%s", "=" * 80)
+        logger.info("\nReports generated:")
+        logger.info("  Excel: %s", excel_path)
+        logger.info("  PDF:   %s", pdf_path)
+        logger.info("\nTotal papers: %d", len(all_papers))
         for cat, label in [
             ("genetics", "Genetics"),
             ("therapeutics", "Therapeutics"),
@@ -690,13 +1261,41 @@ class PKDLiteratureSearch:
             ("cross_species", "Cross-species"),
             ("dataset", "Datasets"),
         ]:
-            print(f"  {label}: {len(categories[cat])}")
+            logger.info("  %s: %d", label, category_counts[cat])
         other_count = (
-            len(categories["clinical"])
-            + len(categories["pathophysiology"])
-            + len(categories["other"])
+            category_counts["clinical"]
+            + category_counts["pathophysiology"]
+            + category_counts["other"]
+        )
+        logger.info("  Other: %d", other_count)
+
+
+# ======================================================================
+# Report workers (top-level so ProcessPoolExecutor can pickle them)
+# ======================================================================
+
+def _build_excel_worker(papers: List[Paper]) -> bytes:
+    with PKDLiteratureSearch("", "", use_cache=False) as searcher:
+        return searcher.create_excel_bytes(papers)
+
+
+def _build_pdf_worker(
+    start_date: str,
+    end_date: str,
+    papers: List[Paper],
+    categories: Dict,
+    pubmed_count: int,
+    biorxiv_count: int,
+    medrxiv_count: int,
+) -> bytes:
+    with PKDLiteratureSearch(start_date, end_date, use_cache=False) as searcher:
+        return searcher.create_pdf_bytes(
+            papers,
+            categories,
+            pubmed_count=pubmed_count,
+            biorxiv_count=biorxiv_count,
+            medrxiv_count=medrxiv_count,
         )
-        print(f"  Other: {other_count}")
 
 
 # ======================================================================
@@ -704,6 +1303,9 @@ class PKDLiteratureSearch:
 # ======================================================================
 
 def main():
+    # Progress messages are plain lines on stdout, as before logging was used
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     parser = argparse.ArgumentParser(
         description="Search PKD literature and generate reports",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -717,6 +1319,14 @@ Examples:
     parser.add_argument("--start", type=str, help="Start date (YYYY-MM-DD). Default: 7 days ago")
     parser.add_argument("--end", type=str, help="End date (YYYY-MM-DD). Default: today")
     parser.add_argument("--output", type=str, default=".", help="Output directory. Default: current directory")
+    parser.add_argument(
+        "--api-key", type=str, default=os.environ.get("NCBI_API_KEY"),
+        help="NCBI API key for faster PubMed requests. Default: $NCBI_API_KEY",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Do not use the on-disk HTTP cache (requires requests-cache)",
+    )
     args = parser.parse_args()
 
     if not args.end:
@@ -729,11 +1339,14 @@ Examples:
         datetime.strptime(args.start, "%Y-%m-%d")
         datetime.strptime(args.end, "%Y-%m-%d")
     except ValueError:
-        print("Error: Dates must be in YYYY-MM-DD format")
+        logger.error("Error: Dates must be in YYYY-MM-DD format")
         return 1
 
-    searcher = PKDLiteratureSearch(args.start, args.end, args.output)
-    searcher.run()
+    with PKDLiteratureSearch(
+        args.start, args.end, args.output,
+        api_key=args.api_key, use_cache=not args.no_cache,
+    ) as searcher:
+        searcher.run()
     return 0
 
 
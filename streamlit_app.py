@@ -4,11 +4,40 @@ PKD Literature Search -- Streamlit App
 Run with:  streamlit run app.py
 """
 
+import pyarrow as pa
 import streamlit as st
 import pandas as pd
 from datetime import date, timedelta
 from pkd_literature_search import PKDLiteratureSearch
 
+# Columns shown in the results table, in display order
+DISPLAY_COL_ORDER = ("title", "authors", "journal", "year", "source", "link")
+
+# Category keys (as returned by categorize_papers) and their display labels
+CATEGORY_LABELS = (
+    ("genetics", "Genetics"),
+    ("therapeutics", "Therapeutics"),
+    ("metabolism", "Metabolism"),
+    ("pathophysiology", "Pathophysiology"),
+    ("clinical", "Clinical"),
+    ("cross_species", "Cross-species"),
+    ("dataset", "Datasets"),
+    ("other", "Other"),
+)
+
+# Column settings for the results grid (reused on every render)
+COLUMN_CONFIG = {
+    "title": st.column_config.TextColumn("Title", width="large"),
+    "authors": st.column_config.TextColumn("Authors", width="medium"),
+    "journal": st.column_config.TextColumn("Journal"),
+    "year": st.column_config.TextColumn("Year", width="small"),
+    "source": st.column_config.TextColumn("Source", width="small"),
+    "link": st.column_config.LinkColumn("Link", width="medium"),
+}
+
+# Longer titles are truncated in the on-screen table (reports keep the full text)
+MAX_TITLE_CHARS = 300
+
 # ---------------------------------------------------------------------------
 # Page config
 # ---------------------------------------------------------------------------
@@ -18,6 +47,96 @@ st.set_page_config(
     layout="wide",
 )
 
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _ncbi_api_key():
+    """NCBI API key from ``st.secrets``, or None when no secrets are configured."""
+    try:
+        return st.secrets.get("NCBI_API_KEY")
+    except Exception:
+        return None
+
+
+@st.cache_resource
+def _http_session():
+    """One pooled HTTP session per server process, shared by all searches."""
+    return PKDLiteratureSearch.create_session()
+
+
+def _searcher(start_str: str, end_str: str) -> PKDLiteratureSearch:
+    """A searcher for one date window; cheap, since it reuses the shared session."""
+    return PKDLiteratureSearch(
+        start_str, end_str, api_key=_ncbi_api_key(), session=_http_session()
+    )
+
+
+class _IncompleteSearch(Exception):
+    """Raised out of ``_run_search`` so partial results are not memoized."""
+
+    def __init__(self, results, failed_sources):
+        super().__init__(", ".join(failed_sources))
+        self.results = results
+        self.failed_sources = failed_sources
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _run_search(start_str: str, end_str: str):
+    """Run all source searches for a date window, memoized for an hour.
+
+    Searches where a source failed raise ``_IncompleteSearch`` (carrying the
+    partial results), which ``st.cache_data`` does not cache, so the next
+    click queries that window again.
+    """
+    searcher = _searcher(start_str, end_str)
+    results = searcher.search_all()
+    if searcher.failed_sources:
+        raise _IncompleteSearch(results, sorted(searcher.failed_sources))
+    return results
+
+
+def _build_results_table(all_papers) -> pa.Table:
+    """Build the results table, including a clickable link column, once per search.
+
+    Only the displayed columns are kept, and long titles are truncated, to
+    keep the payload sent to the browser small. Returned as an Arrow table
+    so ``st.dataframe`` can ship it without re-encoding a pandas DataFrame
+    on every rerun.
+    """
+    df = pd.DataFrame([paper.to_dict() for paper in all_papers])
+
+    view_df = df[[c for c in DISPLAY_COL_ORDER if c in df.columns]].copy()
+    if "title" in view_df.columns:
+        view_df["title"] = view_df["title"].str.slice(0, MAX_TITLE_CHARS)
+    return pa.Table.from_pandas(view_df, preserve_index=False)
+
+
+# Report bytes can be large; keep them only as long as the search they came from
+@st.cache_data(ttl=3600, max_entries=8, show_spinner=False)
+def _report_bytes(
+    start_str: str,
+    end_str: str,
+    papers,
+    categories,
+    pubmed_count: int,
+    biorxiv_count: int,
+    medrxiv_count: int,
+):
+    """``(excel_bytes, pdf_bytes)``, built together and regenerated only when
+    the inputs change.
+
+    The date range is part of the key because it is printed in the PDF.
+    """
+    return _searcher(start_str, end_str).build_reports_bytes(
+        papers,
+        categories,
+        pubmed_count=pubmed_count,
+        biorxiv_count=biorxiv_count,
+        medrxiv_count=medrxiv_count,
+    )
+
+
 st.title("PKD Literature Search")
 st.markdown(
     "Search **PubMed**, **bioRxiv**, and **medRxiv** for recent polycystic kidney "
@@ -27,18 +146,25 @@ st.markdown(
 # ---------------------------------------------------------------------------
 # Sidebar -- date inputs
 # ---------------------------------------------------------------------------
-st.sidebar.header("Search Parameters")
-
 default_end = date.today()
 default_start = default_end - timedelta(days=7)
 
-start_date = st.sidebar.date_input("Start date", value=default_start)
-end_date = st.sidebar.date_input("End date", value=default_end)
-
-if start_date > end_date:
-    st.sidebar.error("Start date must be before end date.")
+# A form so that editing the dates does not rerun the script until submit
+with st.sidebar.form("search_params"):
+    st.header("Search Parameters")
+    start_date = st.date_input("Start date", value=default_start)
+    end_date = st.date_input("End date", value=default_end)
+    run_search = st.form_submit_button(
+        "Run Search", type="primary", width="stretch"
+    )
+    if run_search and start_date > end_date:
+        st.error("Start date must be before end date.")
 
-run_search = st.sidebar.button("Run Search", type="primary", use_container_width=True)
+st.sidebar.header("Display")
+show_all_rows = st.sidebar.checkbox("Show all rows", value=False)
+max_rows = st.sidebar.number_input(
+    "Max rows to display", min_value=100, value=200, step=100, disabled=show_all_rows
+)
 
 # ---------------------------------------------------------------------------
 # Main area
@@ -48,128 +174,140 @@ if run_search and start_date <= end_date:
     start_str = start_date.strftime("%Y-%m-%d")
     end_str = end_date.strftime("%Y-%m-%d")
 
-    searcher = PKDLiteratureSearch(start_str, end_str)
-
     # Run the search with a spinner
     with st.spinner("Searching PubMed, bioRxiv, and medRxiv ..."):
-        all_papers, pubmed, biorxiv, medrxiv, categories = searcher.search_all()
+        try:
+            results = _run_search(start_str, end_str)
+        except _IncompleteSearch as incomplete:
+            results = incomplete.results
+            st.warning(
+                f"Could not reach {', '.join(incomplete.failed_sources)}; the results "
+                "below may be incomplete. Run the search again to retry."
+            )
+    all_papers, pubmed, biorxiv, medrxiv, categories, category_counts = results
 
-    # Store results in session state so they survive reruns
+    table = _build_results_table(all_papers)
+
+    # Store results in session state so they survive reruns. The render path
+    # only needs scalar counts and the display table; the full paper lists
+    # are kept in a separate slot for the report downloads.
     st.session_state["results"] = {
-        "all_papers": all_papers,
-        "pubmed": pubmed,
-        "biorxiv": biorxiv,
-        "medrxiv": medrxiv,
-        "categories": categories,
-        "searcher": searcher,
+        "counts": {
+            "total": len(all_papers),
+            "pubmed": len(pubmed),
+            "biorxiv": len(biorxiv),
+            "medrxiv": len(medrxiv),
+        },
+        "category_counts": category_counts,
+        "arrow_table": table,
+        "display_cols": table.column_names,
         "start_str": start_str,
         "end_str": end_str,
     }
+    st.session_state["report_data"] = {
+        "all_papers": all_papers,
+        "categories": categories,
+    }
 
 # ---------------------------------------------------------------------------
 # Display results (if available)
 # ---------------------------------------------------------------------------
 
-if "results" in st.session_state:
+@st.fragment
+def _render_results(show_all_rows: bool, max_rows: int) -> None:
+    """Render the latest results.
+
+    Runs as a fragment, so interacting with widgets in here (e.g. the
+    download buttons) reruns only this function, not the whole script.
+    """
     res = st.session_state["results"]
-    all_papers = res["all_papers"]
-    pubmed = res["pubmed"]
-    biorxiv = res["biorxiv"]
-    medrxiv = res["medrxiv"]
-    categories = res["categories"]
-    searcher = res["searcher"]
-
-    # Summary metrics
+    counts = res["counts"]
+    category_counts = res["category_counts"]
+
+    if not counts["total"]:
+        st.info("No papers found for this date range.")
+        return
+
+    # Summary counts
     st.subheader("Search Summary")
-    col1, col2, col3, col4 = st.columns(4)
-    col1.metric("Total Papers", len(all_papers))
-    col2.metric("PubMed", len(pubmed))
-    col3.metric("bioRxiv", len(biorxiv))
-    col4.metric("medRxiv", len(medrxiv))
+    summary_df = pd.DataFrame([{
+        "Total Papers": counts["total"],
+        "PubMed": counts["pubmed"],
+        "bioRxiv": counts["biorxiv"],
+        "medRxiv": counts["medrxiv"],
+    }])
+    st.dataframe(summary_df, hide_index=True, width="stretch")
 
     # Category breakdown
     st.subheader("Categories")
-    cat_cols = st.columns(len(categories))
-    labels = {
-        "genetics": "Genetics",
-        "therapeutics": "Therapeutics",
-        "metabolism": "Metabolism",
-        "pathophysiology": "Pathophysiology",
-        "clinical": "Clinical",
-        "cross_species": "Cross-species",
-        "dataset": "Datasets",
-        "other": "Other",
-    }
-    for col, (key, label) in zip(cat_cols, labels.items()):
-        col.metric(label, len(categories[key]))
+    cat_df = pd.DataFrame([{label: category_counts[key] for key, label in CATEGORY_LABELS}])
+    st.dataframe(cat_df, hide_index=True, width="stretch")
 
     # Results table
-    st.subheader(f"Results ({len(all_papers)} papers)")
-
-    if all_papers:
-        df = pd.DataFrame(all_papers)
-
-        # Build a clickable link column
-        def _make_link(row):
-            doi = row.get("doi", "")
-            pmid = row.get("pmid", "")
-            if doi:
-                return f"https://doi.org/{doi}"
-            if pmid:
-                return f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/"
-            return ""
-
-        df["link"] = df.apply(_make_link, axis=1)
-
-        display_cols = ["title", "authors", "journal", "year", "source", "link"]
-        display_cols = [c for c in display_cols if c in df.columns]
-
-        st.dataframe(
-            df[display_cols],
-            use_container_width=True,
-            hide_index=True,
-            column_config={
-                "title": st.column_config.TextColumn("Title", width="large"),
-                "authors": st.column_config.TextColumn("Authors", width="medium"),
-                "journal": st.column_config.TextColumn("Journal"),
-                "year": st.column_config.TextColumn("Year", width="small"),
-                "source": st.column_config.TextColumn("Source", width="small"),
-                "link": st.column_config.LinkColumn("Link", width="medium"),
-            },
+    st.subheader(f"Results ({counts['total']} papers)")
+
+    table = res["arrow_table"]
+    display_cols = res["display_cols"]
+
+    # select/slice are zero-copy on the Arrow table, so the view is cheap per rerun
+    view = table.select(display_cols)
+    if not show_all_rows:
+        view = view.slice(0, max_rows)
+
+    if view.num_rows < table.num_rows:
+        st.caption(
+            f"Showing the first {view.num_rows} of {table.num_rows} papers. "
+            "The Excel and PDF downloads include every paper."
         )
 
-        # Downloads
-        st.subheader("Download Reports")
-        dl_col1, dl_col2 = st.columns(2)
+    st.dataframe(
+        view,
+        key="pkd_results_grid",
+        width="stretch",
+        hide_index=True,
+        column_config=COLUMN_CONFIG,
+    )
 
-        end_fmt = res["end_str"].replace("-", "")
+    # Downloads
+    st.subheader("Download Reports")
+    dl_col1, dl_col2 = st.columns(2)
 
-        with dl_col1:
-            excel_bytes = searcher.create_excel_bytes(all_papers)
-            st.download_button(
-                label="Download Excel",
-                data=excel_bytes,
-                file_name=f"{end_fmt}-PKD-Literature-Data.xlsx",
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                use_container_width=True,
-            )
+    end_fmt = res["end_str"].replace("-", "")
 
-        with dl_col2:
-            pdf_bytes = searcher.create_pdf_bytes(
-                all_papers,
-                categories,
-                pubmed_count=len(pubmed),
-                biorxiv_count=len(biorxiv),
-                medrxiv_count=len(medrxiv),
-            )
-            st.download_button(
-                label="Download PDF",
-                data=pdf_bytes,
-                file_name=f"{end_fmt}-PKD-Literature-Summary.pdf",
-                mime="application/pdf",
-                use_container_width=True,
-            )
-    else:
-        st.info("No papers found for this date range.")
+    # Both reports are built (in parallel) on the first click of either
+    # button; the cached helper makes later clicks return the same bytes.
+    report_data = st.session_state["report_data"]
+
+    def reports():
+        return _report_bytes(
+            res["start_str"],
+            res["end_str"],
+            report_data["all_papers"],
+            report_data["categories"],
+            counts["pubmed"],
+            counts["biorxiv"],
+            counts["medrxiv"],
+        )
+
+    with dl_col1:
+        st.download_button(
+            label="Download Excel",
+            data=lambda: reports()[0],
+            file_name=f"{end_fmt}-PKD-Literature-Data.xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            width="stretch",
+        )
+
+    with dl_col2:
+        st.download_button(
+            label="Download PDF",
+            data=lambda: reports()[1],
+            file_name=f"{end_fmt}-PKD-Literature-Summary.pdf",
+            mime="application/pdf",
+            width="stretch",
+        )
+
+if "results" in st.session_state:
+    _render_results(show_all_rows, int(max_rows))
 else:
     st.info("Select a date range in the sidebar and click **Run Search** to begin.")